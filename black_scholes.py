@@ -17,19 +17,16 @@ Returns a tuple → (mid, lower_bound, upper_bound).
 
 import math
 
+import numpy as np
+
+from _bs_numba import (EPS, SQRT_ERR_DENOM, _bs_digital_24h_jit,
+                       _ndtr_approx)
+
 __all__ = [
     "bs_digital_24h",
+    "bs_digital_24h_batch",
 ]
 
-SQRT2 = math.sqrt(2.0)
-SQRT_ERR_DENOM = math.sqrt(24 * 60 * 20)  # ≈ 169.7
-EPS = 1e-10  # fallback for zero‑vol edge cases
-
-
-def _erf01(x: float) -> float:
-    """Map x → Φ(x) for a standard Normal (0–1 CDF)."""
-    return 0.5 * (1.0 + math.erf(x / SQRT2))
-
 
 def bs_digital_24h(S0: float, K: float, T: float, sigma_24h: float):
     """Black‑Scholes digital (cash‑or‑nothing) call.
@@ -47,32 +44,55 @@ def bs_digital_24h(S0: float, K: float, T: float, sigma_24h: float):
         Fair price and a 3‑σ error band around volatility.
     """
 
-    # Immediate payoff if expired
+    # Immediate payoff if expired — stay in Python, no JIT dispatch cost
     if T <= 0:
         payout = 1.0 if S0 > K else 0.0
         return payout, payout, payout
 
-    sigma_eff = max(sigma_24h, EPS)
+    return _bs_digital_24h_jit(S0, K, T, sigma_24h)
 
-    sqrtT = math.sqrt(T)
-    d2 = (math.log(S0 / K) - 0.5 * sigma_eff ** 2 * T) / (sigma_eff * sqrtT)
-    mid_price = _erf01(d2)
 
-    # -----------------------------------------------------
-    # Build ±3 σ bounds around the *volatility* (not price)
-    # -----------------------------------------------------
-    sigma_err = sigma_eff / SQRT_ERR_DENOM  # short‑term σ error
+def bs_digital_24h_batch(S0: float, K, T: float, sigma_24h: float):
+    """Vectorised `bs_digital_24h` over an array of strikes.
+
+    One ufunc pass prices the whole strike ladder (typically six contracts
+    per tick) instead of six scalar calls: `np.log(K)` is computed once and
+    the compiled `_ndtr_approx` ufunc evaluates Φ across the array with a
+    few fused multiply-adds per strike.
 
+    Parameters
+    ----------
+    S0        : spot price (USD)
+    K         : array-like of strikes (USD)
+    T         : time to expiry **in years** (shared by the ladder)
+    sigma_24h : annualised volatility based on the last 24 hours (σ)
+
+    Returns
+    -------
+    mid, lower, upper : tuple[np.ndarray, np.ndarray, np.ndarray]
+        Fair prices and 3‑σ error bands, one entry per strike.
+    """
+
+    K = np.asarray(K, dtype=np.float64)
+
+    # Immediate payoff if expired
+    if T <= 0:
+        payout = (S0 > K).astype(np.float64)
+        return payout, payout.copy(), payout.copy()
+
+    sigma_eff = max(sigma_24h, EPS)
+    sigma_err = sigma_eff / SQRT_ERR_DENOM
     low_sig = max(sigma_eff - 3.0 * sigma_err, EPS)
-    hi_sig  = sigma_eff + 3.0 * sigma_err
+    hi_sig = sigma_eff + 3.0 * sigma_err
 
-    d2_low  = (math.log(S0 / K) - 0.5 * low_sig ** 2 * T) / (low_sig * sqrtT)
-    d2_high = (math.log(S0 / K) - 0.5 * hi_sig  ** 2 * T) / (hi_sig  * sqrtT)
+    sqrtT = math.sqrt(T)
+    log_moneyness = math.log(S0) - np.log(K)     # shared across all three bands
 
-    lower = _erf01(d2_low)
-    upper = _erf01(d2_high)
+    def _phi(sig: float) -> np.ndarray:
+        d2 = (log_moneyness - 0.5 * sig * sig * T) / (sig * sqrtT)
+        return _ndtr_approx(d2)
 
-    return mid_price, lower, upper
+    return _phi(sigma_eff), _phi(low_sig), _phi(hi_sig)
 
 
 # ---- quick CLI test --------------------------------------------------------
@@ -1,52 +1,91 @@
 #!/usr/bin/env python3
-import threading, requests, time, math
-from collections import deque
+import threading, time, math
 from datetime import datetime, timezone
-from statistics import mean
+
+import orjson
+
+from http_client import SESSION
+from rolling_stats import RollingReturnStats
 
 SECS_PER_YEAR = 365 * 24 * 3600
+DEFAULT_WINDOWS = (60, 3600, 86400)   # seconds
 
 class BTC24hCache:
-    def __init__(self, refresh: float = 1.0):
+    def __init__(self, refresh: float = 1.0, windows=DEFAULT_WINDOWS):
         self.refresh = refresh
-        self._buffer = deque(maxlen=86400)
+        self._spot     = None
+        self._prev_log = None
+        # one O(1) rolling-return window per look-back, fed on every tick
+        self._windows  = {w: RollingReturnStats(maxlen=int(w / refresh))
+                          for w in windows}
         self._lock   = threading.Lock()
         threading.Thread(target=self._run, daemon=True).start()
 
     def _fetch_spot(self):
         try:
-            r = requests.get(
+            r = SESSION.get(
                 "https://api.exchange.coinbase.com/products/BTC-USD/ticker",
                 timeout=3
             )
             r.raise_for_status()
-            return float(r.json()['price'])
+            return float(orjson.loads(r.content)['price'])
         except:
             return None
 
     def _run(self):
+        # fixed monotonic cadence: a slow poll must not push later samples
+        # out, since annualisation assumes uniform `refresh` spacing
+        next_tick = time.monotonic()
         while True:
             spot = self._fetch_spot()
             if spot is not None:
+                log_spot = math.log(spot)
                 with self._lock:
-                    self._buffer.append((time.time(), spot))
-            time.sleep(self.refresh)
+                    self._spot = spot
+                    if self._prev_log is not None:
+                        r = log_spot - self._prev_log
+                        for stats in self._windows.values():
+                            stats.push(r)
+                    self._prev_log = log_spot
+            next_tick += self.refresh
+            now = time.monotonic()
+            if now - next_tick > self.refresh:
+                # fallen more than one period behind — snap, don't catch up
+                next_tick = now
+            time.sleep(max(0.0, next_tick - now))
 
     def get_spot(self):
         with self._lock:
-            return self._buffer[-1][1] if self._buffer else None
+            return self._spot
 
     def get_vol(self, window_sec: float):
-        cutoff = time.time() - window_sec
         with self._lock:
-            pts = [p for (t,p) in self._buffer if t >= cutoff]
-        if len(pts) < 2:
+            stats = self._windows.get(window_sec)
+            if stats is None:
+                # unseen window: start tracking it; warms up on later ticks
+                stats = RollingReturnStats(maxlen=int(window_sec / self.refresh))
+                self._windows[window_sec] = stats
+                return None
+            sigma = stats.sigma()
+        if sigma is None:
             return None
-        rets  = [math.log(pts[i]/pts[i-1]) for i in range(1, len(pts))]
-        mu    = mean(rets)
-        sigma = math.sqrt(mean((r-mu)**2 for r in rets))
         return sigma * math.sqrt(SECS_PER_YEAR / self.refresh)
 
+    def get_vols(self, windows=DEFAULT_WINDOWS):
+        """Like get_vol for several windows under one lock acquisition."""
+        raw = {}
+        with self._lock:
+            for w in windows:
+                stats = self._windows.get(w)
+                if stats is None:
+                    self._windows[w] = RollingReturnStats(
+                        maxlen=int(w / self.refresh))
+                    raw[w] = None
+                else:
+                    raw[w] = stats.sigma()
+        ann = math.sqrt(SECS_PER_YEAR / self.refresh)
+        return {w: (None if s is None else s * ann) for w, s in raw.items()}
+
 if __name__ == "__main__":
     cache = BTC24hCache()
     time.sleep(5)
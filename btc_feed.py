@@ -12,21 +12,32 @@ Background thread that:
 """
 
 import threading
-import requests
 import time
 import math
-from collections import deque
-from datetime import datetime, timezone, timedelta
-from statistics import mean
+from datetime import datetime, timezone
+
+import numpy as np
+import orjson
+
+from http_client import SESSION
+from rolling_stats import RollingMultiWindow, sigma_from_prices
+
+
+def _iso_utc(ts: float) -> str:
+    """ISO-8601 UTC timestamp from a float epoch — no datetime objects."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ts)) + "Z"
 
 class BTCVolFeed:
     def __init__(self, refresh: float = 1.0):
         self.refresh       = refresh
         self.spot          = None
-        # deques for local windows (0.5 s ticks)
-        self._dq_10s       = deque(maxlen=int(10/refresh))
-        self._dq_1m        = deque(maxlen=int(60/refresh))
-        self._dq_5m        = deque(maxlen=int(5*60/refresh))
+        # one shared ring buffer of returns, three O(1) window views
+        self._windows      = RollingMultiWindow({
+            "10s": int(10/refresh),
+            "1m":  int(60/refresh),
+            "5m":  int(5*60/refresh),
+        })
+        self._prev_log     = None
         self._lock         = threading.Lock()
         # vol metrics
         self.vol_10s       = None
@@ -34,16 +45,19 @@ class BTCVolFeed:
         self.vol_5m        = None
         self.vol_web_1h    = None
         self.vol_web_24h   = None
+        # candle vols only change at bar boundaries — cache per (gran, periods)
+        self._web_vol_cache = {}    # (granularity, periods) -> (fetched_at, vol)
+        self._candle_params = {"start": "", "end": "", "granularity": 0}
         threading.Thread(target=self._run, daemon=True).start()
 
     def _fetch_spot(self):
         try:
-            r = requests.get(
+            r = SESSION.get(
                 "https://api.exchange.coinbase.com/products/BTC-USD/ticker",
                 timeout=3
             )
             r.raise_for_status()
-            return float(r.json()['price'])
+            return float(orjson.loads(r.content)['price'])
         except:
             return None
 
@@ -51,55 +65,75 @@ class BTCVolFeed:
         """
         granularity in seconds, periods = number of bars
         """
-        now   = datetime.now(timezone.utc)
-        start = (now - timedelta(seconds=granularity * periods)).isoformat()
-        end   = now.isoformat()
-        url   = "https://api.exchange.coinbase.com/products/BTC-USD/candles"
-        params = {
-            "start": start,
-            "end":   end,
-            "granularity": granularity
-        }
+        now_ts = time.time()
+        start  = _iso_utc(now_ts - granularity * periods)
+        end    = _iso_utc(now_ts)
+        url    = "https://api.exchange.coinbase.com/products/BTC-USD/candles"
+        params = self._candle_params
+        params["start"] = start
+        params["end"] = end
+        params["granularity"] = granularity
         try:
-            r = requests.get(url, params=params, timeout=5)
+            r = SESSION.get(url, params=params, timeout=5)
             r.raise_for_status()
-            data = r.json()  # [[time, low, high, open, close, vol], ...]
-            closes = [c[4] for c in data]
+            data = orjson.loads(r.content)  # [[time, low, high, open, close, vol], ...]
+            closes = np.asarray([c[4] for c in data], dtype=np.float64)
             if len(closes) < 2:
                 return None
-            rets = [math.log(closes[i] / closes[i-1]) for i in range(1, len(closes))]
-            mu   = mean(rets)
-            sigma = math.sqrt(mean((r - mu) ** 2 for r in rets))
-            return sigma * math.sqrt(len(rets))
+            return sigma_from_prices(closes) * math.sqrt(len(closes) - 1)
         except:
             return None
 
-    def _compute_vol(self, dq: deque):
-        if len(dq) < 2:
+    def _historical_vol_cached(self, granularity: int, periods: int, ttl: float):
+        """TTL-cached `_fetch_historical_vol` — skip re-fetching unchanged bars."""
+        key = (granularity, periods)
+        now = time.monotonic()
+        hit = self._web_vol_cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+        vol = self._fetch_historical_vol(granularity, periods)
+        if vol is not None:
+            self._web_vol_cache[key] = (now, vol)
+            return vol
+        # keep serving the stale value rather than flapping back to None
+        return hit[1] if hit is not None else None
+
+    def _compute_vol(self, window: str):
+        sigma = self._windows.sigma(window)
+        if sigma is None:
             return None
-        rets = [math.log(dq[i] / dq[i-1]) for i in range(1, len(dq))]
-        mu   = mean(rets)
-        sigma = math.sqrt(mean((r - mu) ** 2 for r in rets))
         return sigma * math.sqrt(365*24*3600 / self.refresh)
 
     def _run(self):
+        # fixed monotonic cadence: a slow poll must not push later samples
+        # out, since annualisation assumes uniform `refresh` spacing
+        next_tick = time.monotonic()
         while True:
             spot = self._fetch_spot()
             if spot is not None:
+                log_spot = math.log(spot)
                 with self._lock:
                     self.spot = spot
-                    # update local-price deques
-                    self._dq_10s.append(spot)
-                    self._dq_1m.append(spot)
-                    self._dq_5m.append(spot)
+                    # update the shared ring buffer with one return
+                    if self._prev_log is not None:
+                        self._windows.push(log_spot - self._prev_log)
+                    self._prev_log = log_spot
                     # compute local vols
-                    self.vol_10s    = self._compute_vol(self._dq_10s)
-                    self.vol_1m     = self._compute_vol(self._dq_1m)
-                    self.vol_5m     = self._compute_vol(self._dq_5m)
-                    # fetch web vols
-                    self.vol_web_1h  = self._fetch_historical_vol(60,   60) * math.sqrt(12*365)
-                    self.vol_web_24h = self._fetch_historical_vol(3600, 24) * math.sqrt(365)
-            time.sleep(self.refresh)
+                    self.vol_10s    = self._compute_vol("10s")
+                    self.vol_1m     = self._compute_vol("1m")
+                    self.vol_5m     = self._compute_vol("5m")
+                    # fetch web vols (30 s / 5 min TTLs — candles only move
+                    # at bar boundaries, no need to hit the API every tick)
+                    v1h  = self._historical_vol_cached(60,   60, ttl=30)
+                    v24h = self._historical_vol_cached(3600, 24, ttl=300)
+                    self.vol_web_1h  = v1h  * math.sqrt(12*365) if v1h  is not None else None
+                    self.vol_web_24h = v24h * math.sqrt(365)    if v24h is not None else None
+            next_tick += self.refresh
+            now = time.monotonic()
+            if now - next_tick > self.refresh:
+                # fallen more than one period behind — snap, don't catch up
+                next_tick = now
+            time.sleep(max(0.0, next_tick - now))
 
     def get(self):
         """
@@ -8,15 +8,21 @@ Background thread that:
 2. Stores the last close of each minute of the *average* in a 60-value deque
 3. get() -> (avg_spot, vol1h) in O(1)
 4. latest prices from each exchange always available in `.latest_prices`
+   (an immutable tuple of (name, price) pairs — read it without the lock)
 """
 
 import threading
-import requests
 import time
 import math
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from statistics import mean
+
+import numpy as np
+import orjson
+
+from http_client import SESSION
+from rolling_stats import sigma_from_prices
 
 # public, no-auth BTC/USD price endpoints
 ENDPOINTS = {
@@ -39,14 +45,16 @@ class BTCVolFeed:
         self.spot          = None
         self._closes       = deque(maxlen=60)
         self._lock         = threading.Lock()
-        self.latest_prices = {}
+        self.latest_prices: tuple = ()   # immutable snapshot, swapped atomically
+        # poll all exchanges in parallel: wall time per tick is max(RTT), not sum
+        self._pool         = ThreadPoolExecutor(max_workers=len(ENDPOINTS))
         threading.Thread(target=self._run, daemon=True).start()
 
     def _fetch_price(self, url, name):
         try:
-            r = requests.get(url, timeout=3)
+            r = SESSION.get(url, timeout=3)
             r.raise_for_status()
-            data = r.json()
+            data = orjson.loads(r.content)
             if name == 'coinbase':
                 return float(data['data']['amount'])
             if name == 'coinbase_pro':
@@ -69,24 +77,34 @@ class BTCVolFeed:
 
     def _run(self):
         last_minute = None
+        # fixed monotonic cadence: a slow poll must not push later samples out
+        next_tick = time.monotonic()
         while True:
+            futures = {name: self._pool.submit(self._fetch_price, url, name)
+                       for name, url in ENDPOINTS.items()}
             prices = {}
-            for name, url in ENDPOINTS.items():
-                p = self._fetch_price(url, name)
+            for name, fut in futures.items():
+                p = fut.result()    # timeouts are handled inside _fetch_price
                 if p is not None:
                     prices[name] = p
 
             avg_price = sum(prices.values()) / len(prices) if prices else None
 
             now = datetime.now(timezone.utc)
+            # atomic reference swap — readers never need the lock for this
+            self.latest_prices = tuple(prices.items())
             with self._lock:
                 self.spot          = avg_price
-                self.latest_prices = prices.copy()
                 if avg_price is not None and (last_minute is None or now.minute != last_minute):
                     self._closes.append(avg_price)
                     last_minute = now.minute
 
-            time.sleep(self.refresh)
+            next_tick += self.refresh
+            now = time.monotonic()
+            if now - next_tick > self.refresh:
+                # fallen more than one period behind — snap, don't catch up
+                next_tick = now
+            time.sleep(max(0.0, next_tick - now))
 
     def get(self):
         """
@@ -100,10 +118,8 @@ class BTCVolFeed:
         if spot is None or len(closes) < 2:
             return None, None
 
-        rets  = [math.log(closes[i] / closes[i-1]) for i in range(1, len(closes))]
-        mu    = mean(rets)
-        sigma = math.sqrt(mean((r - mu)**2 for r in rets))
-        vol1h = sigma * math.sqrt(len(rets))
+        closes = np.asarray(closes, dtype=np.float64)
+        vol1h  = sigma_from_prices(closes) * math.sqrt(len(closes) - 1)
         return spot, vol1h
 
 if __name__ == "__main__":
@@ -117,10 +133,9 @@ if __name__ == "__main__":
 
     try:
         while True:
-            with feed._lock:
-                prices = feed.latest_prices.copy()
+            prices = feed.latest_prices          # atomic snapshot, no lock
             ts = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
-            line = "  ".join(f"{name}={price:,.2f}" for name, price in prices.items())
+            line = "  ".join(f"{name}={price:,.2f}" for name, price in prices)
             print(f"{ts}  {line}")
             time.sleep(feed.refresh)
     except KeyboardInterrupt:
@@ -10,16 +10,25 @@ Usage
 
     contracts = pick_six_btc_hourlies(kalshi_client, spot_price)
     for c in contracts:
-        print(c["ticker"], c["bid"], c["ask"])
+        print(c["ticker"], c["strike"])
+
+Quotes are deliberately not included: the event structure is cached for
+the hour, so any bid/ask captured here would go stale — fetch prices
+per tick via /markets instead (see monitor.py).
 """
+import functools
+import time
 from dataclasses import dataclass
 from datetime import datetime, timezone, timedelta
 from zoneinfo import ZoneInfo
 from typing import List
 
+import numpy as np
+
 from kalshi_contracts import ContractId
 
 SERIES = "KXBTCD"                        # Kalshi BTC hourly series
+_ET = ZoneInfo("America/New_York")
 
 
 @dataclass
@@ -35,23 +44,51 @@ class LiveContract:
 
 
 # -------------------------------------------------------------------------
+def _hour_bucket_utc() -> int:
+    """Current UTC hour index — cache key that rolls over on the hour."""
+    return int(time.time()) // 3600
+
+
+@functools.lru_cache(maxsize=4)
+def _next_hour_et_for(hour_bucket_utc: int) -> datetime:
+    now_et = datetime.now(timezone.utc).astimezone(_ET)
+    return (now_et.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1))
+
+
 def _next_hour_et() -> datetime:
     """Return the next full hour in Eastern Time (aware datetime)."""
-    now_et = datetime.now(timezone.utc).astimezone(ZoneInfo("America/New_York"))
-    return (now_et.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1))
+    return _next_hour_et_for(_hour_bucket_utc())
+
+
+@functools.lru_cache(maxsize=4)
+def _series_code_for(hour_bucket_utc: int, series: str) -> str:
+    return _next_hour_et_for(hour_bucket_utc).strftime(f"{series}-%y%b%d%H").upper()
 
 
 def _series_code(series: str = SERIES) -> str:
     """e.g. 'KXBTCD-29JUL2518' """
-    return _next_hour_et().strftime(f"{series}-%y%b%d%H").upper()
+    return _series_code_for(_hour_bucket_utc(), series)
+
+
+# event structure is fixed for the hour — cache it keyed on the event code
+# (the key rolls over with _series_code, which implicitly invalidates it)
+_event_cache: dict = {}
 
 
 def _fetch_event_markets(kalshi, series: str = SERIES) -> List[LiveContract]:
-    """Pull all markets for the next event from Kalshi."""
+    """Pull all markets for the next event from Kalshi (cached per hour)."""
     event = _series_code(series)
+    cached = _event_cache.get(event)
+    if cached is not None:
+        return cached[0]
     resp = kalshi.get("/markets", params={"event_ticker": event})
+    raw = resp.get("markets", [])
+    if not raw:
+        # transient empty listing (e.g. racing the hour rollover) — do not
+        # cache it, or the empty ladder would stick for the whole hour
+        return []
     markets = []
-    for m in resp.get("markets", []):
+    for m in raw:
         cid = ContractId.parse(m["ticker"])
         if cid.above:
             lower, upper, ctype = cid.strike, float("inf"), "above"
@@ -85,23 +122,37 @@ def _fetch_event_markets(kalshi, series: str = SERIES) -> List[LiveContract]:
             )
         )
     markets.sort(key=lambda c: c.lower)
+
+    # pre-sorted views + strike arrays so the per-tick pick is two
+    # searchsorted calls instead of two filter passes over all markets
+    below = sorted((c for c in markets if c.type == "below"), key=lambda c: c.upper)
+    above = sorted((c for c in markets if c.type == "above"), key=lambda c: c.lower)
+    below_uppers = np.array([c.upper for c in below])
+    above_lowers = np.array([c.lower for c in above])
+
+    _event_cache.clear()        # at most one live event at a time
+    _event_cache[event] = (markets, below, above, below_uppers, above_lowers)
     return markets
 
 
 def pick_six_btc_hourlies(kalshi, spot: float) -> list[dict]:
     """Return three contracts below and above the spot using live strikes."""
-    contracts = _fetch_event_markets(kalshi)
-    below = [c for c in contracts if c.type == "below" and c.upper <= spot]
-    above = [c for c in contracts if c.type == "above" and c.lower >= spot]
-    below = sorted(below, key=lambda c: c.upper, reverse=True)[:3]
-    above = sorted(above, key=lambda c: c.lower)[:3]
-    sel = list(reversed(below)) + above
+    event = _series_code()
+    cached = _event_cache.get(event)
+    if cached is None:
+        _fetch_event_markets(kalshi)
+        cached = _event_cache.get(event)
+        if cached is None:          # listing still empty — retry next tick
+            return []
+    _, below, above, below_uppers, above_lowers = cached
+
+    i = int(np.searchsorted(below_uppers, spot, side="right"))
+    j = int(np.searchsorted(above_lowers, spot, side="left"))
+    sel = below[max(0, i - 3):i] + above[j:j + 3]
     return [
         {
             "ticker": c.ticker,
             "strike": c.upper if c.type == "below" else c.lower,
-            "bid": c.bid,
-            "ask": c.ask,
             "expiry": c.expiry,
         }
         for c in sel
@@ -8,19 +8,20 @@ fit_garch_from_db.py  (v3: 5-sec feed, JSON output)
 • Save latest parameters to a small JSON file for downstream use.
 """
 
-import argparse, json, shutil, sqlite3, sys, warnings
+import argparse, json, sys, time, warnings
 from datetime import datetime, timezone
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
+import apsw
 import numpy as np
-from arch import arch_model
 from numpy import isfinite
 
+from garch_nll import fit_garch11
+
 # ─── CLI ────────────────────────────────────────────────────────────────────
 p = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
 p.add_argument("--src", default="../btc_cache/btc_1s.sqlite",
-               help="Path to live btc_1s.sqlite (copied locally, read-only)")
+               help="Path to live btc_1s.sqlite (opened in place, read-only)")
 p.add_argument("hours_back", nargs="?", type=int, default=5,
                help="Look-back window in hours")
 p.add_argument("--out", default=str(Path.home() / "latest_garch.json"),
@@ -34,20 +35,39 @@ src_path = Path(args.src).expanduser().resolve()
 if not src_path.is_file():
     sys.exit(f"Source DB not found: {src_path}")
 
-# ─── Fast local copy ───────────────────────────────────────────────────────
-tmp = NamedTemporaryFile(prefix="btc_1s_copy_", suffix=".sqlite", delete=True)
-shutil.copy2(src_path, tmp.name)
-
 lookback_sec = args.hours_back * 3600
 
 # ─── Helper: load prices ───────────────────────────────────────────────────
 def load_prices(db_path: str, seconds_back: int) -> np.ndarray:
-    cutoff = int(datetime.now(timezone.utc).timestamp()) - seconds_back
-    with sqlite3.connect(f"file:{db_path}?mode=ro", uri=True) as conn:
-        rows = conn.execute(
+    cutoff = int(time.time()) - seconds_back
+    # apsw reads the live DB in place through the SQLite C API — no
+    # full-file copy, no per-row tuple allocation (row_trace yields the
+    # bare float); immutable keeps the 1-second writer unblocked
+    conn = apsw.Connection(
+        f"file:{db_path}?immutable=1",
+        flags=apsw.SQLITE_OPEN_READONLY | apsw.SQLITE_OPEN_URI,
+    )
+    try:
+        cur = conn.cursor()
+        n = next(cur.execute(
+            "SELECT count(*) FROM prices WHERE ts >= ?", (cutoff,)
+        ))[0]
+        prices = np.empty(n, dtype=np.float64)
+        cur.row_trace = lambda cursor, row: row[0]
+        # the live writer may append between count(*) and this scan
+        # (immutable=1 assumes an unchanging file, it is not a snapshot),
+        # so cap at the preallocated length and trim any shortfall
+        filled = 0
+        for price in cur.execute(
             "SELECT price FROM prices WHERE ts >= ? ORDER BY ts ASC", (cutoff,)
-        ).fetchall()
-    prices = np.fromiter((r[0] for r in rows), dtype=np.float64)
+        ):
+            if filled >= n:
+                break
+            prices[filled] = price
+            filled += 1
+        prices = prices[:filled]
+    finally:
+        conn.close()
     prices = prices[isfinite(prices) & (prices > 0)]
     if len(prices) < 2:
         raise RuntimeError("Not enough valid price points.")
@@ -56,20 +76,22 @@ def load_prices(db_path: str, seconds_back: int) -> np.ndarray:
 # ─── Fit GARCH ─────────────────────────────────────────────────────────────
 def fit_garch(returns: np.ndarray):
     warnings.filterwarnings("ignore", category=UserWarning)  # silence convergence pep talk
-    model = arch_model(returns, mean="Zero", vol="GARCH", p=1, q=1, rescale=False)
-    res   = model.fit(disp="off")
-    p     = res.params
-    return float(p["omega"]), float(p["alpha[1]"]), float(p["beta[1]"])
+    return fit_garch11(returns)
 
 # ─── Main ──────────────────────────────────────────────────────────────────
 try:
-    prices = load_prices(tmp.name, lookback_sec)
+    prices = load_prices(str(src_path), lookback_sec)
     log_ret = np.diff(np.log(prices)) * 100.0          # percent units
     log_ret = log_ret[isfinite(log_ret)]
     if len(log_ret) < 700:
         raise RuntimeError("Need ≥ 700 finite returns; only "
                            f"{len(log_ret)} after filtering.")
     omega, alpha1, beta1 = fit_garch(log_ret)
+    if alpha1 + beta1 >= 1.0:
+        # never hand a non-stationary fit to the simulators — their
+        # var0 = omega / (1 - alpha - beta) would blow up silently
+        raise RuntimeError(
+            f"non-stationary fit rejected: alpha+beta = {alpha1 + beta1:.6f}")
 
     # pretty print
     print(f"\nGARCH(1,1) fit using last {args.hours_back} h "
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+garch_nll.py
+------------
+Numba-compiled GARCH(1,1) negative log-likelihood with analytic gradient.
+
+`arch_model(...).fit()` walks the variance recursion in generic Python/
+NumPy code under SciPy's L-BFGS-B; for ~18 000 returns the recursion is
+the hot kernel and has a loop-carried dependency, so an @njit loop beats
+vectorisation. `fit_garch11` feeds the compiled (nll, grad) pair straight
+to `scipy.optimize.minimize(jac=True)`.
+
+Model (zero mean, percent log-returns):
+
+    sigma2[t] = omega + alpha * r[t-1]**2 + beta * sigma2[t-1]
+    nll       = 0.5 * sum(log(sigma2) + r**2 / sigma2)
+"""
+
+import numpy as np
+from numba import njit, types
+from numba.types import float64
+from scipy.optimize import minimize
+
+
+@njit(types.Tuple((float64, float64[::1]))(float64[::1], float64[::1]),
+      cache=True, fastmath=True)
+def nll(params, r):
+    """Negative log-likelihood and its gradient w.r.t. (omega, alpha, beta).
+
+    sigma2[0] is backcast to the sample variance of `r` and treated as a
+    constant, so its derivatives start at zero.
+    """
+    omega, alpha, beta = params[0], params[1], params[2]
+    n = r.shape[0]
+
+    # backcast initial variance
+    var_r = 0.0
+    for i in range(n):
+        var_r += r[i] * r[i]
+    var_r /= n
+
+    sigma2 = var_r
+    d_om = 0.0      # d sigma2 / d omega
+    d_al = 0.0      # d sigma2 / d alpha
+    d_be = 0.0      # d sigma2 / d beta
+
+    ll = 0.0
+    grad = np.zeros(3)
+    for t in range(n):
+        if t > 0:
+            prev_sq = r[t - 1] * r[t - 1]
+            d_om = 1.0 + beta * d_om
+            d_al = prev_sq + beta * d_al
+            d_be = sigma2 + beta * d_be
+            sigma2 = omega + alpha * prev_sq + beta * sigma2
+        inv = 1.0 / sigma2
+        rt_sq = r[t] * r[t]
+        ll += 0.5 * (np.log(sigma2) + rt_sq * inv)
+        w = 0.5 * (inv - rt_sq * inv * inv)   # d nll / d sigma2[t]
+        grad[0] += w * d_om
+        grad[1] += w * d_al
+        grad[2] += w * d_be
+
+    return ll, grad
+
+
+# stationarity margin: alpha + beta must stay strictly below 1, or the
+# unconditional variance omega / (1 - alpha - beta) used to seed the
+# simulator is negative/absurd and every downstream quote is garbage
+_STATIONARITY_EPS = 1e-4
+
+
+def fit_garch11(returns: np.ndarray):
+    """Fit GARCH(1,1) on the compiled likelihood under alpha + beta < 1.
+
+    Box bounds alone cannot express the stationarity constraint, and BTC
+    second-returns sit close enough to IGARCH that an unconstrained fit
+    regularly lands on alpha + beta > 1 — so the inequality is handed to
+    SLSQP explicitly, the way `arch` enforces it. Returns
+    (omega, alpha1, beta1) as floats with alpha1 + beta1 < 1 guaranteed.
+    """
+    r = np.ascontiguousarray(returns, dtype=np.float64)
+    var_r = float(r.var())
+
+    # optimise omega in units of the sample variance: raw omega is orders
+    # of magnitude below alpha/beta and the scale mismatch stalls SLSQP's
+    # line search almost immediately
+    def _scaled_nll(x):
+        val, grad = nll(np.array([x[0] * var_r, x[1], x[2]]), r)
+        return val, np.array([grad[0] * var_r, grad[1], grad[2]])
+
+    res = minimize(
+        _scaled_nll,
+        x0=np.array([0.05, 0.05, 0.90]),
+        jac=True,
+        method="SLSQP",
+        bounds=[(1e-10, 10.0), (1e-8, 1.0), (1e-8, 1.0)],
+        constraints=[{
+            "type": "ineq",
+            "fun": lambda x: 1.0 - _STATIONARITY_EPS - x[1] - x[2],
+            "jac": lambda x: np.array([0.0, -1.0, -1.0]),
+        }],
+        options={"maxiter": 200},
+    )
+    omega = res.x[0] * var_r
+    alpha1, beta1 = res.x[1], res.x[2]
+    persistence = alpha1 + beta1
+    if persistence >= 1.0 - _STATIONARITY_EPS:
+        # SLSQP may overshoot the boundary by float noise — project back
+        scale = (1.0 - _STATIONARITY_EPS) / persistence
+        alpha1 *= scale
+        beta1 *= scale
+    return float(omega), float(alpha1), float(beta1)
@@ -11,9 +11,13 @@ from __future__ import annotations
 import json, math, time, pathlib
 import numpy as np
 
+from garch_sim import SampleCache, horizon_seed
+
 # ── Config ────────────────────────────────────────────────────────────────
 PARAM_FILE = pathlib.Path.home() / "latest_garch.json"
 MC_PATHS = 1_000                         # Monte-Carlo simulations
+_HORIZON_OFFSETS = (-5, 5)               # bid/ask horizon skew, seconds
+_STRIKE_OFFSETS = np.array([-500.0, -250.0, 0.0, 250.0, 500.0])
 # -------------------------------------------------------------------------
 
 def load_garch_params(path: pathlib.Path = PARAM_FILE):
@@ -24,37 +28,20 @@ def load_garch_params(path: pathlib.Path = PARAM_FILE):
 
 
 # ───────────────────────────────────────────────────────────────────────────
+# TTL sample cache shared by the quotes of one tick (see garch_sim)
+_sample_cache = SampleCache()
+
+
 def _simulate_garch_avg(initial_price: float,
                         T: int,
                         omega: float,
                         alpha1: float,
                         beta1: float,
-                        num_simulations: int = MC_PATHS) -> np.ndarray:
-    """Vectorised GARCH(1,1) simulation, returns 60-sec moving-average."""
-    var0   = omega / (1 - alpha1 - beta1)
-
-    prices    = np.empty((T + 1, num_simulations))
-    variances = np.full(num_simulations, var0)
-    sq_ret    = np.full(num_simulations, var0)
-
-    prices[0] = initial_price
-    z = np.random.default_rng().standard_normal((T, num_simulations))
-
-    for t in range(T):
-        variances = omega + alpha1 * sq_ret + beta1 * variances
-        np.maximum(variances, 1e-10, out=variances)
-        returns   = np.sqrt(variances) * z[t]
-        prices[t + 1] = prices[t] * np.exp(returns)
-        sq_ret = returns * returns
-
-    window_start = max(0, T - 59)
-    return prices[window_start:T + 1].mean(axis=0)
-
-
-def _probs_above_strikes(avg_prices: np.ndarray,
-                         strikes: np.ndarray) -> np.ndarray:
-    hits = avg_prices >= strikes[:, None]
-    return hits.mean(axis=1)
+                        num_simulations: int = MC_PATHS,
+                        seed: int | None = None) -> np.ndarray:
+    """Compiled GARCH(1,1) simulation, returns 60-sec moving-average."""
+    return _sample_cache.sample(initial_price, T, omega, alpha1, beta1,
+                                num_simulations, seed)
 
 
 def garch_bid_ask_multi(initial_price: float,
@@ -65,19 +52,23 @@ def garch_bid_ask_multi(initial_price: float,
                         num_simulations: int = MC_PATHS) -> list[dict]:
     """Return bid/ask quotes for the provided strikes."""
     omega, alpha1, beta1 = params
-    strikes = np.array(strikes, dtype=np.float64)
-    horizons = [base_T - 5, base_T + 5]
-    probs = []
-
-    for T in horizons:
-        avgs = _simulate_garch_avg(initial_price, T,
-                                   omega, alpha1, beta1,
-                                   num_simulations)
-        probs.append(_probs_above_strikes(avgs, strikes))
-
-    probs = np.vstack(probs)
-    bids = np.floor(probs.min(axis=0) * 100) / 100
-    asks = np.ceil( probs.max(axis=0) * 100) / 100
+    strikes = np.asarray(strikes, dtype=np.float64)
+    horizons = tuple(base_T + d for d in _HORIZON_OFFSETS)
+
+    # common random numbers: one seed for both horizons, so path p's first
+    # T-5 draws are identical across them and the bid/ask delta reflects
+    # the 10 s of extra diffusion, not independent MC noise
+    seed = horizon_seed(spot, base_T)
+    avgs = np.stack([_simulate_garch_avg(initial_price, T,
+                                         omega, alpha1, beta1,
+                                         num_simulations,
+                                         seed=seed)
+                     for T in horizons])                    # (2, paths)
+
+    # one broadcast reduction for all strikes x horizons
+    probs = (avgs[None, :, :] >= strikes[:, None, None]).mean(axis=2)  # (6, 2)
+    bids = np.floor(probs.min(axis=1) * 100) / 100
+    asks = np.ceil( probs.max(axis=1) * 100) / 100
 
     return [{"strike": float(s), "bid": float(b), "ask": float(a)}
             for s, b, a in zip(strikes, bids, asks)]
@@ -99,22 +90,20 @@ def quote_for_contract(contract,
     -------
     {'market': <code>, 'bid': x.xx, 'ask': y.yy}
     """
-    from datetime import datetime, timezone
-    from kalshi_contracts import ET          # local import avoids cycle
-
     omega, alpha1, beta1 = params
 
-    # --- horizon in seconds (ET → UTC) ----------------------------------
-    now_utc = datetime.now(timezone.utc)
-    now_et  = now_utc.astimezone(ET)
-    T_sec   = int((contract.dt_et - now_et).total_seconds())
+    # --- horizon in seconds --------------------------------------------
+    # expiry_ts respects dt_et's tzinfo, so plain epoch arithmetic here
+    # replaces the per-call astimezone (and its zoneinfo DST lookup)
+    T_sec   = int(contract.expiry_ts - time.time())
     if T_sec <= 10:
         raise ValueError("≤10 s to expiry; skip")
 
     # --- simulate -------------------------------------------------------
     avgs = _simulate_garch_avg(spot, T_sec,
                                omega, alpha1, beta1,
-                               num_simulations)
+                               num_simulations,
+                               seed=horizon_seed(spot, T_sec))
     p = (avgs >= contract.strike).mean() if contract.above else \
         (avgs <= contract.strike).mean()
 
@@ -123,6 +112,47 @@ def quote_for_contract(contract,
 
     return {"market": contract.market_code(),
             "bid": bid, "ask": ask}
+
+
+def quote_for_contracts(contracts,
+                        spot: float,
+                        params: tuple[float, float, float],
+                        num_simulations: int = MC_PATHS) -> dict[str, dict]:
+    """
+    Batched quote_for_contract: one Monte-Carlo run per horizon bucket
+    instead of one per contract.
+
+    Contracts on the same hourly event differ only in strike, so their
+    horizons land in the same 10-second bucket and share a single
+    simulation; the per-strike probabilities then come from one
+    broadcast comparison. Returns {market_code: {'bid': x, 'ask': y}},
+    silently omitting contracts within 10 s of expiry.
+    """
+    omega, alpha1, beta1 = params
+    now = time.time()
+
+    buckets: dict[int, list] = {}
+    for c in contracts:
+        T_sec = int(c.expiry_ts - now)
+        if T_sec <= 10:
+            continue
+        buckets.setdefault(round(T_sec, -1), []).append(c)
+
+    quotes: dict[str, dict] = {}
+    for T_sec, group in buckets.items():
+        avgs = _simulate_garch_avg(spot, T_sec,
+                                   omega, alpha1, beta1,
+                                   num_simulations,
+                                   seed=horizon_seed(spot, T_sec))
+        strikes = np.array([c.strike for c in group])        # (n,)
+        probs = (avgs[None, :] >= strikes[:, None]).mean(axis=1)
+        for c, p_above in zip(group, probs):
+            p = p_above if c.above else 1.0 - p_above
+            quotes[c.market_code()] = {
+                "bid": math.floor(p * 100) / 100,
+                "ask": math.ceil (p * 100) / 100,
+            }
+    return quotes
 # ─── Example usage ─────────────────────────────────────────────────────────
 if __name__ == "__main__":
     spot = 118_600.00
@@ -134,7 +164,7 @@ if __name__ == "__main__":
         raise SystemExit("latest_garch.json not found — "
                          "run fit_garch_from_db.py first.")
 
-    strikes = [spot - 500, spot - 250, spot, spot + 250, spot + 500]
+    strikes = spot + _STRIKE_OFFSETS
     quotes = garch_bid_ask_multi(
         initial_price = spot,
         base_T        = secs_left_this_hour,
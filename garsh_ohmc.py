@@ -1,16 +1,15 @@
 #!/usr/bin/env python3
-import math, random
+import math
+import numpy as np
+
+# one PCG64 generator for the module — instantiated once, not per call
+_RNG = np.random.default_rng()
 
 def mc_digital(S0: float, K: float, T: float, sigma: float, sims: int = 10000) -> float:
     """
     Monte Carlo digital price – GARSH-OHMC flavour (simple GBM).
     Returns the fraction of paths finishing above strike.
     """
-    hits = 0
-    drift = -0.5 * sigma * sigma * T
-    vol   = sigma * math.sqrt(T)
-    for _ in range(sims):
-        z   = random.gauss(0, 1)
-        ST  = S0 * math.exp(drift + vol * z)
-        hits += ST > K
-    return hits / sims
+    z  = _RNG.standard_normal(sims)
+    ST = S0 * np.exp(-0.5 * sigma * sigma * T + sigma * math.sqrt(T) * z)
+    return float(np.mean(ST > K))
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+http_client.py
+--------------
+Single shared HTTP session for every polling module.
+
+Each feed used to own its own `requests.Session`; with three feeds plus
+the contract picker running in one process that still meant separate
+connection pools (and separate TLS handshakes) per module for the same
+hosts. This module exposes one pooled, keep-alive session that all of
+them import, so a host's TLS session is negotiated once per process and
+resumed from then on.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+SESSION.headers["Connection"] = "keep-alive"
@@ -6,13 +6,14 @@ Usage:
     k = Kalshi(env="demo")              # or env="live"
     positions = k.get("/portfolio/positions")["positions"]
 """
-import os, json, time, base64, hashlib
+import os, json, time, base64, hashlib, threading
 from pathlib import Path
 from typing import Dict, Any
 from dotenv import load_dotenv
 import requests
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
 class Kalshi:
     def __init__(self, env: str = "demo"):
@@ -27,21 +28,46 @@ class Kalshi:
         with pem_path.open("rb") as f:
             self._priv = serialization.load_pem_private_key(f.read(), password=None)
         self._key_id = key_id
+        # Ed25519 signs in ~50 µs vs ~0.5 ms for RSA-PSS — register an
+        # Ed25519 key with Kalshi to get the fast path, same headers
+        self._is_ed25519 = isinstance(self._priv, Ed25519PrivateKey)
+        self._full_paths: Dict[str, str] = {}    # path -> prefix+path
+
+        # signing shares one key object across threads — serialize access so
+        # callers may fan requests out over a thread pool
+        self._sign_lock = threading.Lock()
+
+        # persistent keep-alive session — one TLS handshake per process,
+        # not one per API call
+        self._session = requests.Session()
+        self._session.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=8, pool_maxsize=8))
 
     # ---------- internal helpers ----------
     def _sign(self, ts: str, method: str, path: str) -> str:
         msg = f"{ts}{method}{path}".encode()
-        sig = self._priv.sign(
-            msg,
-            padding.PSS(mgf=padding.MGF1(hashes.SHA256()),
-                        salt_length=padding.PSS.DIGEST_LENGTH),
-            hashes.SHA256(),
-        )
+        with self._sign_lock:
+            if self._is_ed25519:
+                sig = self._priv.sign(msg)
+            else:
+                sig = self._priv.sign(
+                    msg,
+                    padding.PSS(mgf=padding.MGF1(hashes.SHA256()),
+                                salt_length=padding.PSS.DIGEST_LENGTH),
+                    hashes.SHA256(),
+                )
         return base64.b64encode(sig).decode()
 
+    def _full_path(self, path: str) -> str:
+        """Memoised prefix+path — the same few endpoints repeat every tick."""
+        full = self._full_paths.get(path)
+        if full is None:
+            full = self._full_paths[path] = self._api_prefix + path
+        return full
+
     def _headers(self, method: str, path: str) -> Dict[str, str]:
         ts  = str(int(time.time() * 1000))
-        sig = self._sign(ts, method, self._api_prefix + path)
+        sig = self._sign(ts, method, self._full_path(path))
         return {
             "KALSHI-ACCESS-KEY":       self._key_id,
             "KALSHI-ACCESS-TIMESTAMP": ts,
@@ -50,8 +76,8 @@ class Kalshi:
 
     # ---------- public request wrapper ----------
     def request(self, method: str, path: str, **kw):
-        url = f"https://{self.base}{self._api_prefix}{path}"
-        resp = requests.request(method, url, headers=self._headers(method, path),
+        url = f"https://{self.base}{self._full_path(path)}"
+        resp = self._session.request(method, url, headers=self._headers(method, path),
                             timeout=10, **kw)
         resp.raise_for_status()
         return resp.json()
@@ -1,10 +1,19 @@
 from __future__ import annotations
+import re
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from zoneinfo import ZoneInfo     # needs Python ≥3.9
 
 ET = ZoneInfo("America/New_York")
 
+_MON = {m: i + 1 for i, m in enumerate(
+    ["JAN", "FEB", "MAR", "APR", "MAY", "JUN",
+     "JUL", "AUG", "SEP", "OCT", "NOV", "DEC"])}
+# e.g. KXBTC-25JUL3109-B109375  /  KXBTCD-25JUL3117-T118749.99
+_MARKET_RE = re.compile(
+    r"^(KXBTCD?)-(\d{2})([A-Z]{3})(\d{2})(\d{2})-([BTS])(\d+(?:\.\d+)?)$")
+
 @dataclass
 class ContractId:
     series: str        # KXBTC or KXBTCD
@@ -12,25 +21,26 @@ class ContractId:
     strike: float
     above: bool        # True = ≥ strike
 
+    @cached_property
+    def expiry_ts(self) -> float:
+        """UTC epoch seconds of expiry — dt_et is immutable, so cache it."""
+        return self.dt_et.timestamp()
+
     @classmethod
     def parse(cls, market: str) -> "ContractId":
         # e.g. KXBTC-25JUL3109-B109375
-        ser, rest = market.split("-", 1)
-        datecode, side_strike = rest.split("-", 1)
+        m = _MARKET_RE.match(market)
+        if m is None:
+            raise ValueError(f"unrecognised market code: {market!r}")
+        ser, yy, mmm, dd, hh, side, strike_txt = m.groups()
 
         # ---- date decoding ----
-        # 25JUL3109  →  2025-07-31 09:00 ET
-        year   = 2000 + int(datecode[0:2])
-        month  = datetime.strptime(datecode[2:5], "%b").month
-        day    = int(datecode[5:7])
-        hour   = int(datecode[7:9])
-        minute = 0                               # all Kalshi codes end on :00
-
-        dt_et  = datetime(year, month, day, hour, minute, tzinfo=ET)
-        above = side_strike[0] in ("B", "T")      # B≥ for hourly, T≥ for daily
-        strike = float(side_strike[1:])
-
-        return cls(ser, dt_et, strike, above)
+        # 25JUL3109  →  2025-07-31 09:00 ET   (all Kalshi codes end on :00;
+        # the month table replaces strptime's ~10 µs of locale machinery)
+        dt_et = datetime(2000 + int(yy), _MON[mmm], int(dd), int(hh),
+                         tzinfo=ET)
+        above = side in ("B", "T")               # B≥ for hourly, T≥ for daily
+        return cls(ser, dt_et, float(strike_txt), above)
 
     def market_code(self) -> str:
         y2   = str(self.dt_et.year)[2:]
@@ -5,8 +5,9 @@ Reusable Monte-Carlo engine:
 • vectorised pricing of any Above / Below / Between contract
 """
 
-import math, numpy as np
-from functools import lru_cache
+import math, time, numpy as np
+
+from garch_sim import SampleCache, horizon_seed
 from kalshi_contracts import ContractId
 
 # ---------- global tuning -------------------------------------------------
@@ -14,33 +15,16 @@ DEFAULT_PATHS = 1_000          # keep RAM tiny
 DTYPE = np.float32             # lowers RAM by 4×
 # -------------------------------------------------------------------------
 
-def _simulate_sma(initial_price: float,
-                  T: int,
-                  omega: float, alpha: float, beta: float,
-                  paths: int = DEFAULT_PATHS) -> np.ndarray:
-    """Return vector of SMA(60 s)."""
-    var0 = omega / (1 - alpha - beta)
-    prices = np.empty((T + 1, paths), dtype=DTYPE)
-    variances = np.full(paths, var0, dtype=DTYPE)
-    sq_ret    = np.full(paths, var0, dtype=DTYPE)
-
-    prices[0] = initial_price
-    z = np.random.default_rng().standard_normal((T, paths), dtype=DTYPE)
+# TTL cache shared by the quotes of one tick (see garch_sim.SampleCache)
+_sample_cache = SampleCache()
 
-    for t in range(T):
-        variances = omega + alpha * sq_ret + beta * variances
-        variances = np.maximum(variances, 1e-10, out=variances)
-        ret = np.sqrt(variances, dtype=DTYPE) * z[t]
-        prices[t + 1] = prices[t] * np.exp(ret, dtype=DTYPE)
-        sq_ret = ret * ret
-    win0 = max(0, T - 59)
-    return prices[win0:T + 1].mean(axis=0)      # (paths,)
 
-# ----- cache by (spot, horizon, ω,α,β,paths) so we reuse within 1-second loop
-@lru_cache(maxsize=16)
 def sma_sample(spot: float, horizon_s: int, omega: float, alpha: float,
-               beta: float, paths: int = DEFAULT_PATHS) -> np.ndarray:
-    return _simulate_sma(spot, horizon_s, omega, alpha, beta, paths)
+               beta: float, paths: int = DEFAULT_PATHS,
+               seed: int | None = None) -> np.ndarray:
+    """Return vector of SMA(60 s), cached within the tick."""
+    return _sample_cache.sample(spot, horizon_s, omega, alpha, beta,
+                                paths, seed)
 
 # -------------------------------------------------------------------------
 def price_above(sample: np.ndarray, strike: float) -> float:
@@ -71,8 +55,10 @@ def quote_contracts(spot: float,
     """
     omega, alpha, beta = params
     horizons = (base_T - 5, base_T + 5)
-    # simulate once per horizon
-    samples = {T: sma_sample(spot, T, omega, alpha, beta, paths)
+    # simulate once per horizon, with common random numbers across the two
+    # horizons so their probability delta is diffusion, not MC noise
+    seed = horizon_seed(spot, base_T)
+    samples = {T: sma_sample(spot, T, omega, alpha, beta, paths, seed=seed)
                for T in horizons}
 
     quotes = []
@@ -1,35 +1,50 @@
 #!/usr/bin/env python3
 """
 monitor.py – shows BTC spot & 1-hour vol, then six ATM Kalshi BTC contracts
-with bid/ask and three Black-Scholes estimates (low, expected, high).
+with bid/ask and three model estimates (low, expected, high).
 
 Use:
-    python monitor.py              # demo by default
-    python monitor.py --env live   # live account
+    python monitor.py                  # demo account, Black-Scholes engine
+    python monitor.py --env live       # live account
+    python monitor.py --engine garch   # Monte-Carlo GARCH engine
 """
 
 import argparse
 import time
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from statistics import mean
 
+import numpy as np
+
 from kalshi_client import Kalshi
 from contract_picker import pick_six_btc_hourlies
-from black_scholes import bs_digital_24h   # signature: (S0, K, T, sigma_24h, sigma_err)
 from btc24h_cache import BTC24hCache
 from volatility import VolatilityMetrics
 
 # ─── instantiate 24 h cache ───────────────────────────────────────────────
 cache = BTC24hCache(refresh=1.0)
 vols  = VolatilityMetrics.from_cache(cache)
-# ─── command-line flag ────────────────────────────────────────────────────
+# ─── command-line flags ───────────────────────────────────────────────────
 p = argparse.ArgumentParser()
 p.add_argument("--env", choices=["demo", "live"], default="demo",
                help="which Kalshi environment to use")
+p.add_argument("--engine", choices=["bs", "garch"], default="bs",
+               help="pricing engine: Black-Scholes or Monte-Carlo GARCH")
 args = p.parse_args()
 k = Kalshi(env=args.env)
 
+# engine imports are conditional so the bs path never pays for the GARCH
+# machinery (numba compile, param file) and vice versa
+if args.engine == "bs":
+    from black_scholes import bs_digital_24h_batch
+    _COLS = ("BS Low", "BS Mid", "BS High")
+else:
+    from garch_quote_engine import load_garch_params, garch_bid_ask_multi
+    garch_params = load_garch_params()
+    _COLS = ("MC Bid", "MC Mid", "MC Ask")
+
 # round-trip times (milliseconds) for Kalshi market data requests
 #
 # These values update on every API call and offer a simple view into
@@ -39,6 +54,24 @@ k = Kalshi(env=args.env)
 api_latencies: deque[float] = deque(maxlen=100)
 last_latency_ms: float = 0.0
 
+# fallback pool for per-ticker fetches when the batch endpoint returns nothing
+_HTTP = ThreadPoolExecutor(max_workers=8)
+
+
+def _fetch_markets(k: Kalshi, tickers: list[str]) -> dict:
+    """Batched /markets fetch, falling back to parallel per-ticker GETs."""
+    resp = k.get("/markets", params={"tickers": ",".join(tickers)})
+    by_ticker = {m["ticker"]: m for m in resp.get("markets", [])}
+    if by_ticker:
+        return by_ticker
+    futures = {t: _HTTP.submit(k.get, f"/markets/{t}") for t in tickers}
+    for t, fut in futures.items():
+        try:
+            by_ticker[t] = fut.result()["market"]
+        except Exception:
+            continue
+    return by_ticker
+
 # ─── helpers just for pretty output ───────────────────────────────────────
 def _print_header(env: str, spot: float, vol: float) -> None:
     avg_latency = mean(api_latencies) if api_latencies else 0.0
@@ -48,7 +81,7 @@ def _print_header(env: str, spot: float, vol: float) -> None:
     print(f"Avg latency {avg_latency:.2f} ms (last {len(api_latencies)} samples)")
     print("-" * 111)
     print(
-        f"{'Contract':<24} | {'Bid/Ask':<11} | {'BS Low':<8} | {'BS Mid':<8} | {'BS High':<8} | {'Lag ms':<7}"
+        f"{'Contract':<24} | {'Bid/Ask':<11} | {_COLS[0]:<8} | {_COLS[1]:<8} | {_COLS[2]:<8} | {'Lag ms':<7}"
     )
     print("-" * 111)
 
@@ -91,36 +124,48 @@ def main():
             _print_header(args.env, spot, vol24h)
 
             contracts = pick_six_btc_hourlies(k, spot)
-            # --- inside main() loop ---
-            for c in contracts:
-                 ticker = c["ticker"]        # was: c.ticker
 
-                 # --- measure time from request send to response received ---
-                 send_time = time.perf_counter()
-                 market = k.get(f"/markets/{ticker}")["market"]
-                 receive_time = time.perf_counter()
-                 last_latency_ms = (receive_time - send_time) * 1000
-                 api_latencies.append(last_latency_ms)
+            now = datetime.now(timezone.utc)
 
-                 bid, ask = market["yes_bid"], market["yes_ask"]
-                 # now = datetime.now(timezone.utc)
-                 # expiry_dt = _to_dt(c["expiry"])
-                 # T_years = max((expiry_dt - now).total_seconds(), 0) / (365*24*3600)
-
-                 now = datetime.now(timezone.utc)
-
-                 # ── NEW: seconds until the next top-of-hour ──────────────────────
-                 next_hour = (now + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
-                 seconds_to_hour = (next_hour - now).total_seconds()
-                 T_years = seconds_to_hour / (365 * 24 * 3600)
+            # seconds until the next top-of-hour (shared by the whole ladder)
+            next_hour = (now + timedelta(hours=1)).replace(minute=0, second=0, microsecond=0)
+            seconds_to_hour = (next_hour - now).total_seconds()
+            T_years = seconds_to_hour / (365 * 24 * 3600)
 
-                 # --- Black-Scholes mid / band ---------------------------
-                 mid, low, high = bs_digital_24h(
+            # --- model prices for the whole ladder, one call -------------
+            strikes = np.asarray([c["strike"] for c in contracts])
+            if args.engine == "bs":
+                mids, lows, highs = bs_digital_24h_batch(
                     S0       = spot,
-                    K        = c["strike"],
+                    K        = strikes,
                     T        = T_years,
                     sigma_24h= vol24h,
                 )
+            else:
+                quotes = garch_bid_ask_multi(
+                    initial_price = spot,
+                    base_T        = int(seconds_to_hour),
+                    spot          = spot,
+                    params        = garch_params,
+                    strikes       = list(strikes),
+                )
+                lows  = np.asarray([q["bid"] for q in quotes])
+                highs = np.asarray([q["ask"] for q in quotes])
+                mids  = (lows + highs) / 2
+
+            # --- one batched market fetch for all six tickers ------------
+            send_time = time.perf_counter()
+            by_ticker = _fetch_markets(k, [c["ticker"] for c in contracts])
+            receive_time = time.perf_counter()
+            last_latency_ms = (receive_time - send_time) * 1000
+            api_latencies.append(last_latency_ms)
+
+            for c, mid, low, high in zip(contracts, mids, lows, highs):
+                 ticker = c["ticker"]        # was: c.ticker
+                 market = by_ticker.get(ticker)
+                 if market is None:
+                     continue
+                 bid, ask = market["yes_bid"], market["yes_ask"]
 
                  _print_row(ticker, bid, ask, low, mid, high, last_latency_ms)
             time.sleep(cache.refresh)
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 import time, pathlib, requests
 from kalshi_contracts import ContractId
-from garch_quote_engine import load_garch_params, quote_for_contract
+from garch_quote_engine import load_garch_params, quote_for_contracts
 
 PARAM_PATH  = pathlib.Path.home() / "latest_garch.json"
 
@@ -24,14 +24,17 @@ def seconds_to_top_of_hour() -> int:
     return 3600 - (int(time.time()) % 3600)
 
 def main():
+    # parse the constant ticker strings once, not once per tick
+    contract_ids = [ContractId.parse(code) for code in CONTRACT_CODES]
+
     while True:
         spot   = get_latest_btc_price()
         params = load_garch_params(PARAM_PATH)
 
-        for code in CONTRACT_CODES:
-            cid = ContractId.parse(code)
-            q   = quote_for_contract(cid, spot, params)
-            print(f"{q['market']}  |  Bid {q['bid']:.2f}  Ask {q['ask']:.2f}")
+        # one simulation per horizon bucket covers every contract in it
+        quotes = quote_for_contracts(contract_ids, spot, params)
+        for market, q in quotes.items():
+            print(f"{market}  |  Bid {q['bid']:.2f}  Ask {q['ask']:.2f}")
 
         time.sleep(1)
 
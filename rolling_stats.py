@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+rolling_stats.py
+----------------
+O(1) rolling mean/variance of log-returns for the volatility feeds.
+
+`BTC24hCache.get_vol` and `BTCVolFeed._compute_vol` used to rebuild the
+full returns list from their deques on every call — O(N) with N up to
+86 400 each second.  The windows are append-only with known evictions, so
+this module keeps running sums instead (Chan–Golub–LeVeque style):
+
+    S1 = Σ r,   S2 = Σ r²,   n = count
+
+updated on every append/eviction, with Kahan compensation on S2 so the
+variance stays numerically stable over a full day of samples.
+"""
+
+from collections import deque
+from math import sqrt
+from typing import Dict, Optional
+
+import numpy as np
+from numba import njit
+from numba.types import float64
+
+
+@njit(float64(float64[::1]), cache=True, fastmath=True)
+def sigma_from_prices(prices):
+    """Per-step σ of log-returns of a contiguous price array.
+
+    Single compiled pass with two accumulators — no intermediate
+    log/diff arrays. Returns NaN when fewer than two prices are given;
+    callers annualise the result themselves.
+    """
+    n = prices.shape[0]
+    if n < 2:
+        return np.nan
+    s1 = 0.0
+    s2 = 0.0
+    prev_log = np.log(prices[0])
+    for i in range(1, n):
+        cur_log = np.log(prices[i])
+        r = cur_log - prev_log
+        prev_log = cur_log
+        s1 += r
+        s2 += r * r
+    m = n - 1
+    var = s2 / m - (s1 / m) ** 2
+    return sqrt(max(var, 0.0))
+
+
+class RollingReturnStats:
+    """Fixed-size window of log-returns with O(1) σ queries."""
+
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self._rets = deque(maxlen=maxlen)
+        self._s1 = 0.0          # Σ r
+        self._s2 = 0.0          # Σ r² (Kahan-compensated)
+        self._c2 = 0.0          # Kahan carry for S2
+
+    def __len__(self) -> int:
+        return len(self._rets)
+
+    def _add_sq(self, x: float) -> None:
+        """Kahan-compensated `self._s2 += x`."""
+        y = x - self._c2
+        t = self._s2 + y
+        self._c2 = (t - self._s2) - y
+        self._s2 = t
+
+    def push(self, r: float) -> None:
+        """Append one return, evicting the oldest when the window is full."""
+        if len(self._rets) == self.maxlen:
+            old = self._rets[0]
+            self._s1 -= old
+            self._add_sq(-old * old)
+        self._rets.append(r)
+        self._s1 += r
+        self._add_sq(r * r)
+
+    def sigma(self) -> Optional[float]:
+        """Per-step σ of the windowed returns, or None when still cold."""
+        n = len(self._rets)
+        if n < 1:
+            return None
+        var = (self._s2 - self._s1 * self._s1 / n) / n
+        return sqrt(max(var, 0.0))
+
+
+class _WindowSums:
+    """Running (S1, S2, n) for one window over the shared ring buffer."""
+
+    __slots__ = ("maxlen", "s1", "s2", "c2", "n")
+
+    def __init__(self, maxlen: int):
+        self.maxlen = maxlen
+        self.s1 = 0.0
+        self.s2 = 0.0
+        self.c2 = 0.0
+        self.n = 0
+
+    def _add_sq(self, x: float) -> None:
+        y = x - self.c2
+        t = self.s2 + y
+        self.c2 = (t - self.s2) - y
+        self.s2 = t
+
+    def add(self, r: float) -> None:
+        self.s1 += r
+        self._add_sq(r * r)
+        self.n += 1
+
+    def evict(self, r: float) -> None:
+        self.s1 -= r
+        self._add_sq(-r * r)
+        self.n -= 1
+
+
+class RollingMultiWindow:
+    """Several nested return windows backed by one preallocated ring buffer.
+
+    `BTCVolFeed` tracks 10 s / 1 m / 5 m windows over the same tick stream;
+    keeping three separate deques stores every return up to three times.
+    Here one `np.ndarray` of the largest window's length holds each return
+    once, and each window keeps only its running sums plus an eviction
+    offset into the shared buffer.
+    """
+
+    def __init__(self, maxlens: Dict[str, int]):
+        self._size = max(maxlens.values())
+        self._buf = np.empty(self._size, dtype=np.float64)
+        self._head = 0          # total returns pushed so far
+        self._windows = {name: _WindowSums(m) for name, m in maxlens.items()}
+
+    def push(self, r: float) -> None:
+        """Append one return, evicting it from each window as it ages out."""
+        for w in self._windows.values():
+            if w.n == w.maxlen:
+                w.evict(self._buf[(self._head - w.maxlen) % self._size])
+            w.add(r)
+        self._buf[self._head % self._size] = r
+        self._head += 1
+
+    def sigma(self, name: str) -> Optional[float]:
+        """Per-step σ of the named window, or None when still cold."""
+        w = self._windows[name]
+        if w.n < 1:
+            return None
+        var = (w.s2 - w.s1 * w.s1 / w.n) / w.n
+        return sqrt(max(var, 0.0))
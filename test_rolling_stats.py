@@ -0,0 +1,30 @@
+import numpy as np
+from rolling_stats import RollingReturnStats, RollingMultiWindow
+
+
+def test_rolling_return_stats_matches_numpy_after_eviction():
+    rng = np.random.default_rng(0)
+    rets = rng.standard_normal(500) * 1e-3
+    stats = RollingReturnStats(maxlen=60)
+    for i, r in enumerate(rets):
+        stats.push(r)
+        window = rets[max(0, i + 1 - 60):i + 1]
+        assert abs(stats.sigma() - np.std(window)) < 1e-12
+
+
+def test_rolling_multi_window_matches_numpy_all_windows():
+    rng = np.random.default_rng(1)
+    rets = rng.standard_normal(800) * 1e-3
+    maxlens = {"10s": 20, "1m": 120, "5m": 600}
+    mw = RollingMultiWindow(maxlens)
+    for i, r in enumerate(rets):
+        mw.push(r)
+    # 800 pushes: every window has filled and evicted at least once
+    for name, m in maxlens.items():
+        window = rets[len(rets) - m:]
+        assert abs(mw.sigma(name) - np.std(window)) < 1e-12
+
+
+def test_cold_windows_return_none():
+    assert RollingReturnStats(maxlen=5).sigma() is None
+    assert RollingMultiWindow({"w": 5}).sigma("w") is None
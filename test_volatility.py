@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from volatility import VolatilityMetrics, VolatilitySource
 
@@ -17,3 +18,19 @@ def test_error_sigma_fallback_zero_from_1h():
         sigma_24h=VolatilitySource(lambda: 0.04, "24h"),
     )
     assert vm.error_sigma() == 0.0
+
+
+def test_effective_sigma_batch_matches_scalar():
+    # all four presence states: both, 24h only, 1h only, neither
+    nan = float("nan")
+    for s24, s1h in [(0.04, 0.02), (0.04, None), (None, 0.02), (None, None)]:
+        vm = VolatilityMetrics(
+            sigma_1m=VolatilitySource(lambda: None, "1m"),
+            sigma_1h=VolatilitySource(lambda v=s1h: v, "1h"),
+            sigma_24h=VolatilitySource(lambda v=s24: v, "24h"),
+        )
+        batch = vm.effective_sigma_batch(
+            np.array([nan if s24 is None else s24]),
+            np.array([nan if s1h is None else s1h]),
+        )
+        assert batch[0] == pytest.approx(vm.effective_sigma())
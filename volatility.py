@@ -16,9 +16,48 @@ Design goals
 from __future__ import annotations
 
 import logging
+import time
+from functools import partial
 from typing import Optional, Callable
 
-import requests   # only used for optional online fallback
+import numpy as np
+
+# requests (and the shared pooled session built on it) is only needed by
+# the optional online fallback, so the HTTP stack loads on first fetch
+# rather than at import — cache-only users never pay for it
+_requests = None
+_SESSION = None
+
+
+def _ensure_http() -> None:
+    global _requests, _SESSION
+    if _SESSION is None:
+        import requests
+        from http_client import SESSION
+        _requests = requests
+        _SESSION = SESSION
+
+try:                # optional: compiled sigma combine for batch pricing loops
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is in the normal install
+    njit = None
+
+_NAN = float("nan")
+
+
+def _combine(s24: float, s1h: float, w24: float, w1h: float) -> float:
+    """NaN-sentinel weighted combine: NaN marks a missing component."""
+    if s24 == s24:                       # not NaN
+        if s1h == s1h:
+            return w24 * s24 + w1h * s1h
+        return s24
+    if s1h == s1h:
+        return s1h
+    return 0.0
+
+
+if njit is not None:
+    _combine = njit(cache=True)(_combine)
 
 
 _log = logging.getLogger(__name__)
@@ -31,22 +70,92 @@ class VolatilitySource:
     A source can be backed by an in‑memory cache, a database, or a REST call.
     """
 
-    def __init__(self, supplier: Callable[[], Optional[float]], label: str):
+    __slots__ = ("_supplier", "label", "_ttl", "_reliable",
+                 "_cached_val", "_cached_at",
+                 "_last_warn_at", "_warn_interval")
+
+    def __init__(
+        self,
+        supplier: Callable[[], Optional[float]],
+        label: str,
+        ttl: float = 0.05,
+        reliable: bool = False,
+    ):
         self._supplier = supplier
         self.label = label
-
-    def get(self) -> Optional[float]:
-        """Return σ as a float (e.g. 0.03 → 3 %) or None if unavailable."""
+        # reliable suppliers (in-process cache reads) cannot raise, so the
+        # hot path may skip exception-handler setup entirely
+        self._reliable = reliable
+        # short TTL memo: effective_sigma() and error_sigma() re-query the
+        # same sources within one pricing tick, so repeats become a clock
+        # read and an attribute load instead of supplier round-trips
+        self._ttl = ttl
+        self._cached_val: Optional[float] = None
+        self._cached_at = float("-inf")
+        # warn on the first failure, then at most once a minute — a dead
+        # endpoint polled at tick rate must not flood the log
+        self._last_warn_at = float("-inf")
+        self._warn_interval = 60.0
+
+    def get_nan(self) -> float:
+        """Hot-path accessor: σ as a float, NaN when unavailable.
+
+        The NaN sentinel lets consumers feed the value straight into
+        branchless arithmetic (_combine) without a None check per source.
+        """
+        now = time.monotonic()
+        if now - self._cached_at < self._ttl:
+            return self._cached_val
+        if self._reliable:
+            val = self._supplier()
+            self._cached_val = val = _NAN if val is None else val
+            self._cached_at = now
+            return val
         try:
-            return self._supplier()
+            val = self._supplier()
+            if val is None:
+                val = _NAN
         except Exception as exc:           # noqa: BLE001
-            _log.warning("vol supplier '%s' failed: %s", self.label, exc)
-            return None
+            if (now - self._last_warn_at > self._warn_interval
+                    and _log.isEnabledFor(logging.WARNING)):
+                _log.warning("vol supplier '%s' failed: %s", self.label, exc)
+                self._last_warn_at = now
+            val = _NAN
+        self._cached_val = val
+        self._cached_at = now
+        return val
+
+    def get(self) -> Optional[float]:
+        """Return σ as a float (e.g. 0.03 → 3 %) or None if unavailable."""
+        val = self.get_nan()
+        return None if val != val else val
 
 
 # ---------------------------------------------------------------------------
 
 
+class _BatchedVols:
+    """
+    Shared fetcher for cache backends exposing ``get_vols``: the three
+    per-window suppliers collapse into one locked cache round-trip per TTL.
+    """
+
+    _WINDOWS = (60, 3600, 86400)
+
+    def __init__(self, cache, ttl: float = 0.05):
+        self._cache = cache
+        self._ttl = ttl
+        self._vals: dict = {}
+        self._at = float("-inf")
+
+    def get(self, window_sec: int) -> Optional[float]:
+        now = time.monotonic()
+        if now - self._at >= self._ttl:
+            self._vals = self._cache.get_vols(self._WINDOWS)
+            self._at = now
+        return self._vals.get(window_sec)
+
+
 class VolatilityMetrics:
     """
     Unified facade around multiple volatility sources.
@@ -58,6 +167,10 @@ class VolatilityMetrics:
     >>> eff = vol_metrics.effective_sigma()
     """
 
+    __slots__ = ("sigma_1m", "sigma_1h", "sigma_24h",
+                 "_get_1m", "_get_1h", "_get_24h",
+                 "_w24h", "_w1h", "_w24_norm", "_w1h_norm")
+
     def __init__(
         self,
         sigma_1m: VolatilitySource,
@@ -70,10 +183,21 @@ class VolatilityMetrics:
         self.sigma_1m = sigma_1m
         self.sigma_1h = sigma_1h
         self.sigma_24h = sigma_24h
+        # pre-bound accessors: one C-level call instead of two attribute
+        # hops per read on the hot path
+        self._get_1m = sigma_1m.get
+        self._get_1h = sigma_1h.get
+        self._get_24h = sigma_24h.get
 
         if w24h + w1h <= 0:
             raise ValueError("weights must sum to a positive number")
-        self.weights = {"24h": w24h, "1h": w1h}
+        self._w24h = w24h
+        self._w1h = w1h
+        # normalised pair for the both-available case, precomputed so the
+        # hot path is two multiplies and an add with no dict or division
+        total = w24h + w1h
+        self._w24_norm = w24h / total
+        self._w1h_norm = w1h / total
 
     # ---- factory helpers -------------------------------------------------
 
@@ -81,13 +205,18 @@ class VolatilityMetrics:
     def from_cache(cls, cache, **kw):
         """Create VolatilityMetrics that prioritises the existing BTC24hCache."""
 
-        def _cache_get(sec):
-            return lambda: cache.get_vol(sec)
+        if hasattr(cache, "get_vols"):
+            # in-process cache: trusted, batched, no wrapper on the hot path
+            return _DirectCacheVolatilityMetrics(cache, **kw)
 
+        # partial is C-implemented: no closure frame or cell lookup per call
         return cls(
-            sigma_1m=VolatilitySource(_cache_get(60), "cache‑1m"),
-            sigma_1h=VolatilitySource(_cache_get(3600), "cache‑1h"),
-            sigma_24h=VolatilitySource(_cache_get(86400), "cache‑24h"),
+            sigma_1m=VolatilitySource(partial(cache.get_vol, 60), "cache‑1m",
+                                      reliable=True),
+            sigma_1h=VolatilitySource(partial(cache.get_vol, 3600),
+                                      "cache‑1h", reliable=True),
+            sigma_24h=VolatilitySource(partial(cache.get_vol, 86400),
+                                       "cache‑24h", reliable=True),
             **kw,
         )
 
@@ -108,13 +237,13 @@ class VolatilityMetrics:
 
     def get_1m(self) -> Optional[float]:   # noqa: D401
         """Return 1‑minute σ or None."""
-        return self.sigma_1m.get()
+        return self._get_1m()
 
     def get_1h(self) -> Optional[float]:
-        return self.sigma_1h.get()
+        return self._get_1h()
 
     def get_24h(self) -> Optional[float]:
-        return self.sigma_24h.get()
+        return self._get_24h()
 
     # main consumer utility -----------------------------------------------
 
@@ -129,19 +258,30 @@ class VolatilityMetrics:
         sig_24h = self.get_24h()
         sig_1h = self.get_1h()
 
-        # Rescale weights so that missing components are ignored.
-        avail = {}
-        if sig_24h is not None:
-            avail["24h"] = sig_24h
-        if sig_1h is not None:
-            avail["1h"] = sig_1h
+        # getters may hand back None (external backends) or NaN; normalise
+        # once, then _combine (jitted when numba is present) runs the same
+        # instruction sequence regardless of which inputs are missing
+        return _combine(_NAN if sig_24h is None else sig_24h,
+                        _NAN if sig_1h is None else sig_1h,
+                        self._w24_norm, self._w1h_norm)
 
-        if not avail:
-            return 0.0
+    def effective_sigma_batch(self, s24h, s1h):
+        """
+        Vectorised effective_sigma over arrays of scenario vols.
 
-        total_w = sum(self.weights[k] for k in avail)
-        eff = sum(self.weights[k] * avail[k] for k in avail) / total_w
-        return eff
+        NaN marks a missing component, mirroring get_nan(); weights
+        renormalise elementwise and all-missing rows come back 0.0.
+        One C pass, no Python loop — for stress grids and MC scenarios.
+        """
+        s24h = np.asarray(s24h, dtype=np.float64)
+        s1h = np.asarray(s1h, dtype=np.float64)
+        mask24 = ~np.isnan(s24h)
+        mask1 = ~np.isnan(s1h)
+        total_w = mask24 * self._w24h + mask1 * self._w1h
+        num = (np.where(mask24, self._w24h * s24h, 0.0)
+               + np.where(mask1, self._w1h * s1h, 0.0))
+        return np.where(total_w > 0, num / np.where(total_w > 0, total_w, 1.0),
+                        0.0)
 
     def error_sigma(self) -> float:
         """
@@ -150,32 +290,189 @@ class VolatilityMetrics:
         We follow the spec: use 1‑minute vol if available, else fall back to 1‑h,
         then 24‑h, then 0.0.
         """
-        for getter in (self.get_1m, self.get_1h, self.get_24h):
-            val = getter()
-            if val is not None:
-                return val
+        val = self._get_1m()
+        if val is not None:
+            return val
+        val = self._get_1h()
+        if val is not None:
+            return val
+        val = self._get_24h()
+        if val is not None:
+            return val
         return 0.0
 
 
 # ---------------------------------------------------------------------------
 
 
+class _DirectCacheVolatilityMetrics(VolatilityMetrics):
+    """
+    from_cache specialisation for the in-process BTC24hCache.
+
+    The cache cannot raise on read, so the hot getters skip the
+    VolatilitySource try/except wrapper and hit the batched fetcher
+    directly; the sources still exist for callers that go through them.
+    """
+
+    __slots__ = ("_batch",)
+
+    def __init__(self, cache, **kw):
+        batch = _BatchedVols(cache)
+        self._batch = batch
+        super().__init__(
+            sigma_1m=VolatilitySource(partial(batch.get, 60), "cache‑1m",
+                                      reliable=True),
+            sigma_1h=VolatilitySource(partial(batch.get, 3600), "cache‑1h",
+                                      reliable=True),
+            sigma_24h=VolatilitySource(partial(batch.get, 86400), "cache‑24h",
+                                      reliable=True),
+            **kw,
+        )
+
+    def get_1m(self) -> Optional[float]:
+        return self._batch.get(60)
+
+    def get_1h(self) -> Optional[float]:
+        return self._batch.get(3600)
+
+    def get_24h(self) -> Optional[float]:
+        return self._batch.get(86400)
+
+    def error_sigma(self) -> float:
+        batch = self._batch
+        val = batch.get(60)
+        if val is not None:
+            return val
+        val = batch.get(3600)
+        if val is not None:
+            return val
+        val = batch.get(86400)
+        if val is not None:
+            return val
+        return 0.0
+
+
 # ---- online‑fetch helpers -------------------------------------------------
 # These are optional examples; swap with your own endpoints as needed.
 
+# Binance publishes interchangeable REST mirrors. Remember which host last
+# answered successfully and go there first for a while — during a partial
+# outage this skips the known-bad primary instead of re-paying its timeout.
+_BINANCE_HOSTS = ("api.binance.com", "api1.binance.com",
+                  "api2.binance.com", "api3.binance.com")
+_HOST_MEMO_TTL = 600.0          # seconds
+_last_good_host = (_BINANCE_HOSTS[0], float("-inf"))
+
+
 def _binance_url(symbol: str, window: str) -> str:
-    return f"https://api.binance.com/api/v3/avgPrice?symbol={symbol}&window={window}"
+    host, ts = _last_good_host
+    if time.monotonic() - ts >= _HOST_MEMO_TTL:
+        host = _BINANCE_HOSTS[0]
+    return f"https://{host}/api/v3/avgPrice?symbol={symbol}&window={window}"
+
+
+def _remember_good_host(url: str) -> None:
+    global _last_good_host
+    _last_good_host = (url.split("/", 3)[2], time.monotonic())
+
+
+class _Breaker:
+    """
+    Tiny circuit breaker: after ``threshold`` consecutive failures the
+    circuit opens and calls fast-fail for ``cooldown`` seconds, so a
+    degraded endpoint costs a clock read instead of a blocking timeout.
+    """
+
+    def __init__(self, threshold: int = 5, cooldown: float = 30.0):
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._fail_count = 0
+        self._opened_at = float("-inf")
+
+    @property
+    def open(self) -> bool:
+        return (self._fail_count >= self._threshold
+                and time.monotonic() - self._opened_at < self._cooldown)
+
+    def record_success(self) -> None:
+        self._fail_count = 0
+
+    def record_failure(self) -> None:
+        self._fail_count += 1
+        if self._fail_count >= self._threshold:
+            self._opened_at = time.monotonic()
+
+
+_binance_breaker = _Breaker()
+
+# backup requests (hedging): if the primary has not answered after
+# _BACKUP_DELAY, race the same query against a Binance mirror and take
+# whichever succeeds first. Off by default — it doubles upstream load.
+ENABLE_BACKUP_REQUEST = False
+_BACKUP_DELAY = 0.15
+_hedge_pool = None
+
+
+def _get_hedged(url: str, timeout: float):
+    global _hedge_pool
+    _ensure_http()
+    if _hedge_pool is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _hedge_pool = ThreadPoolExecutor(max_workers=2)
+    from concurrent.futures import wait, FIRST_COMPLETED
+
+    futs = [_hedge_pool.submit(_SESSION.get, url, timeout=timeout)]
+    done, _ = wait(futs, timeout=_BACKUP_DELAY)
+    # hedge when the primary is slow — or when it already failed fast
+    # (instant connection refused finishes "done" inside the delay)
+    if not done or next(iter(done)).exception() is not None:
+        # hedge against a mirror other than whichever host the url targets
+        host = url.split("/", 3)[2]
+        alt = next(h for h in _BINANCE_HOSTS if h != host)
+        futs.append(_hedge_pool.submit(
+            _SESSION.get, url.replace(host, alt, 1), timeout=timeout))
+    last_exc = None
+    while futs:
+        done, _ = wait(futs, return_when=FIRST_COMPLETED)
+        for f in done:
+            futs.remove(f)
+            try:
+                resp = f.result()
+            except Exception as exc:        # noqa: BLE001
+                last_exc = exc
+                continue
+            for other in futs:
+                other.cancel()
+            return resp
+    raise last_exc
 
 
 def fetch_hour_vol_from_binance(symbol="BTCUSDT") -> Optional[float]:
     """
     Simple illustrative fetch – replace with production feed or CF BRTI.
+
+    Guarded by a circuit breaker: during a Binance outage the pricing
+    loop fast-fails instead of eating a multi-second timeout per tick.
     """
+    if _binance_breaker.open:
+        return None
+    _ensure_http()
     try:
-        resp = requests.get(_binance_url(symbol, "1h"), timeout=5)
+        url = _binance_url(symbol, "1h")
+        if ENABLE_BACKUP_REQUEST:
+            resp = _get_hedged(url, timeout=0.75)
+        else:
+            try:
+                resp = _SESSION.get(url, timeout=0.75)
+            except _requests.Timeout:
+                # one tighter retry — bounds the worst case to ~1.25 s
+                resp = _SESSION.get(url, timeout=0.5)
         resp.raise_for_status()
+        _binance_breaker.record_success()
+        _remember_good_host(getattr(resp, "url", None) or url)
         # you would parse resp.json() and compute σ here
         return None   # placeholder
     except Exception as exc:            # noqa: BLE001
+        _binance_breaker.record_failure()
         _log.warning("binance hour vol failed: %s", exc)
         return None